@@ -6,15 +6,26 @@ Website HTML5 + SEO Auditor (Tkinter) with auto-download of vnu.jar (Nu HTML Che
 Includes actionable insights for developers based on HTML5, accessibility, and SEO.
 """
 import os
+import re
+import queue
+import atexit
+import socket
 import sys
 import threading
 import time
 import json
-import tempfile
 import subprocess
-import shutil
+import functools
+import fnmatch
+import io
+import base64
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
 
 from bs4 import BeautifulSoup
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:
+    LexborHTMLParser = None
 import tkinter as tk
 from tkinter import messagebox, scrolledtext, filedialog
 from PIL import Image, ImageTk
@@ -22,6 +33,8 @@ from PIL import Image, ImageTk
 import requests
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.common.exceptions import TimeoutException
 
 # ----------------------------
 # Configuration / Paths
@@ -29,13 +42,30 @@ from selenium.webdriver.chrome.options import Options
 ROOT = os.path.dirname(os.path.abspath(__file__))
 VALIDATOR_DIR = os.path.join(ROOT, "validator")
 VNU_PATH = os.path.join(VALIDATOR_DIR, "vnu.jar")
+VNU_PART_PATH = VNU_PATH + ".part"
+VNU_ETAG_PATH = os.path.join(VALIDATOR_DIR, "vnu.etag")
+VNU_PART_ETAG_PATH = VNU_PART_PATH + ".etag"
 if sys.platform.startswith("win"):
     JAVA_EMBED = os.path.join(VALIDATOR_DIR, "jre", "bin", "java.exe")
 else:
     JAVA_EMBED = os.path.join(VALIDATOR_DIR, "jre", "bin", "java")
 VNU_DOWNLOAD_URL = "https://github.com/validator/validator/releases/latest/download/vnu.jar"
 VNU_DOWNLOAD_TIMEOUT = 60
+VNU_DOWNLOAD_CHUNK = 256 * 1024
+VNU_PROGRESS_STEP = 512 * 1024
 VNU_RUN_TIMEOUT = 30
+VNU_SERVER_HOST = "127.0.0.1"
+VNU_SERVER_START_TIMEOUT = 20
+DRIVER_POOL_SIZE = 1
+DRIVER_IDLE_TIMEOUT = 10 * 60
+PAGE_LOAD_TIMEOUT = 15
+CAPTURE_SCREENSHOT = True
+BLOCKED_URL_PATTERNS = [
+    "*.woff", "*.woff2", "*.ttf",
+    "*://*.doubleclick.net/*", "*://*.google-analytics.com/*", "*://*.googletagmanager.com/*",
+]
+DOCTYPE_RE = re.compile(rb"^\s*<!doctype\s*([^>]*)>", re.I)
+ROBOTS_RE = re.compile(r"noindex|nofollow|nosnippet|max-image-preview:(?:large|standard|none)", re.I)
 
 # ----------------------------
 # Utilities
@@ -44,13 +74,21 @@ def ensure_validator_dir():
     if not os.path.isdir(VALIDATOR_DIR):
         os.makedirs(VALIDATOR_DIR, exist_ok=True)
 
+_java_executable = None
+
 def find_java_executable():
+    # Only successful probes are cached, so installing Java mid-session still works.
+    global _java_executable
+    if _java_executable:
+        return _java_executable
     if os.path.isfile(JAVA_EMBED) and os.access(JAVA_EMBED, os.X_OK):
-        return JAVA_EMBED
+        _java_executable = JAVA_EMBED
+        return _java_executable
     for java_cmd in ("java",):
         try:
             subprocess.run([java_cmd, "-version"], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=3)
-            return java_cmd
+            _java_executable = java_cmd
+            return _java_executable
         except Exception:
             continue
     return None
@@ -58,160 +96,541 @@ def find_java_executable():
 # ----------------------------
 # Auto-download vnu.jar
 # ----------------------------
+def read_text_file(path):
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return f.read().strip() or None
+    except OSError:
+        return None
+
+def write_text_file(path, text):
+    if text:
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(text)
+    elif os.path.exists(path):
+        os.remove(path)
+
+def discard_partial_download():
+    for path in (VNU_PART_PATH, VNU_PART_ETAG_PATH):
+        try:
+            if os.path.exists(path):
+                os.remove(path)
+        except OSError:
+            pass
+
+def vnu_jar_is_current():
+    if not os.path.isfile(VNU_PATH):
+        return False
+    etag = read_text_file(VNU_ETAG_PATH)
+    if not etag:
+        # Installed by hand (or before ETags were tracked); leave it alone.
+        return True
+    try:
+        r = requests.head(VNU_DOWNLOAD_URL, allow_redirects=True, timeout=5)
+        r.raise_for_status()
+    except Exception:
+        return True
+    if r.headers.get("ETag") != etag:
+        return False
+    length = int(r.headers.get("content-length") or 0)
+    return not length or os.path.getsize(VNU_PATH) == length
+
 def download_vnu_jar(progress_callback=None):
     ensure_validator_dir()
     try:
-        with requests.get(VNU_DOWNLOAD_URL, stream=True, timeout=VNU_DOWNLOAD_TIMEOUT) as r:
-            r.raise_for_status()
-            total = int(r.headers.get("content-length") or 0) or None
-            tmp_path = os.path.join(VALIDATOR_DIR, "vnu.jar.part")
-            with open(tmp_path, "wb") as f:
-                downloaded = 0
-                for chunk in r.iter_content(chunk_size=8192):
-                    if not chunk:
-                        continue
-                    f.write(chunk)
-                    downloaded += len(chunk)
-                    if progress_callback:
-                        try:
-                            progress_callback(downloaded, total)
-                        except Exception:
-                            pass
-            shutil.move(tmp_path, VNU_PATH)
-        return True, None
+        for _ in range(2):
+            resume_from = os.path.getsize(VNU_PART_PATH) if os.path.isfile(VNU_PART_PATH) else 0
+            part_etag = read_text_file(VNU_PART_ETAG_PATH)
+            headers = {}
+            if resume_from and part_etag:
+                # If-Range makes the server send the whole file if it changed since.
+                headers["Range"] = f"bytes={resume_from}-"
+                headers["If-Range"] = part_etag
+            with requests.get(VNU_DOWNLOAD_URL, stream=True, timeout=VNU_DOWNLOAD_TIMEOUT, headers=headers) as r:
+                if r.status_code == 416:
+                    discard_partial_download()
+                    continue
+                r.raise_for_status()
+                resumed = r.status_code == 206 and "Range" in headers
+                if not resumed:
+                    resume_from = 0
+                    part_etag = r.headers.get("ETag")
+                    write_text_file(VNU_PART_ETAG_PATH, part_etag)
+                length = int(r.headers.get("content-length") or 0)
+                total = resume_from + length if length else None
+                with open(VNU_PART_PATH, "ab" if resumed else "wb") as f:
+                    downloaded = resume_from
+                    last_reported = downloaded
+                    for chunk in r.iter_content(chunk_size=VNU_DOWNLOAD_CHUNK):
+                        if not chunk:
+                            continue
+                        f.write(chunk)
+                        downloaded += len(chunk)
+                        if progress_callback and (downloaded - last_reported >= VNU_PROGRESS_STEP or downloaded == total):
+                            last_reported = downloaded
+                            try:
+                                progress_callback(downloaded, total)
+                            except Exception:
+                                pass
+            if total and os.path.getsize(VNU_PART_PATH) != total:
+                raise IOError(f"Incomplete download ({os.path.getsize(VNU_PART_PATH)} of {total} bytes)")
+            os.replace(VNU_PART_PATH, VNU_PATH)
+            write_text_file(VNU_ETAG_PATH, part_etag)
+            discard_partial_download()
+            return True, None
+        return False, "Server rejected the resume request."
     except Exception as e:
-        try:
-            part = os.path.join(VALIDATOR_DIR, "vnu.jar.part")
-            if os.path.exists(part):
-                os.remove(part)
-        except Exception:
-            pass
+        # Keep vnu.jar.part so the next attempt can resume where this one stopped.
         return False, str(e)
 
 # ----------------------------
 # Run vnu validator on HTML text
 # ----------------------------
+class VnuServer:
+    """Keeps one vnu JVM running in HTTP mode so validations skip JVM startup."""
+
+    def __init__(self):
+        self.port = None
+        self.proc = None
+        self._lock = threading.Lock()
+
+    @property
+    def url(self):
+        return f"http://{VNU_SERVER_HOST}:{self.port}/?out=json&parser=html5"
+
+    def is_running(self):
+        return self.proc is not None and self.proc.poll() is None
+
+    def is_ready(self):
+        # The port is only recorded once the server answers on it.
+        return self.is_running() and self.port is not None
+
+    def _port_open(self, port):
+        try:
+            with socket.create_connection((VNU_SERVER_HOST, port), timeout=0.5):
+                return True
+        except OSError:
+            return False
+
+    def _free_port(self):
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+            sock.bind((VNU_SERVER_HOST, 0))
+            return sock.getsockname()[1]
+
+    def start(self, java_exec):
+        with self._lock:
+            if self.is_running():
+                return True
+            try:
+                port = self._free_port()
+                # Something else grabbed the port before vnu could; don't talk to it.
+                if self._port_open(port):
+                    return False
+                # vnu listens on every interface unless told otherwise.
+                self.proc = subprocess.Popen(
+                    [java_exec, f"-Dnu.validator.servlet.bind-address={VNU_SERVER_HOST}",
+                     "-cp", VNU_PATH, "nu.validator.servlet.Main", str(port)],
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL
+                )
+            except Exception:
+                self.proc = None
+                return False
+            deadline = time.time() + VNU_SERVER_START_TIMEOUT
+            while time.time() < deadline:
+                if self.proc.poll() is not None:
+                    break
+                if self._port_open(port):
+                    self.port = port
+                    return True
+                time.sleep(0.2)
+        self.stop()
+        return False
+
+    def stop(self):
+        proc, self.proc = self.proc, None
+        self.port = None
+        if proc is None or proc.poll() is not None:
+            return
+        try:
+            proc.terminate()
+            proc.wait(timeout=5)
+        except Exception:
+            proc.kill()
+
+VNU_SERVER = VnuServer()
+atexit.register(VNU_SERVER.stop)
+
+def start_vnu_server():
+    if not os.path.isfile(VNU_PATH):
+        return False
+    java_exec = find_java_executable()
+    if not java_exec:
+        return False
+    return VNU_SERVER.start(java_exec)
+
+def validate_with_vnu_server(html_text):
+    r = requests.post(
+        VNU_SERVER.url,
+        data=html_text.encode("utf-8"),
+        headers={"Content-Type": "text/html; charset=utf-8"},
+        timeout=VNU_RUN_TIMEOUT
+    )
+    r.raise_for_status()
+    messages = r.json().get("messages", [])
+    if not any(m.get("type") in ("error", "non-document-error") for m in messages):
+        return {"available": True, "valid": True, "messages": [], "error": None}
+    return {"available": True, "valid": False, "messages": messages, "error": None}
+
 def validate_with_vnu(html_text):
     if not os.path.isfile(VNU_PATH):
         return {"available": False, "valid": None, "messages": [], "error": "vnu.jar not found."}
+    # The server attempt and the java -jar fallback share one VNU_RUN_TIMEOUT
+    # budget, which is what audit_website_selenium waits for.
+    deadline = time.time() + VNU_RUN_TIMEOUT
+    if VNU_SERVER.is_ready():
+        try:
+            return validate_with_vnu_server(html_text)
+        except requests.Timeout:
+            return {"available": True, "valid": None, "messages": [], "error": "Validation timed out."}
+        except Exception:
+            pass
     java_exec = find_java_executable()
     if not java_exec:
         return {"available": False, "valid": None, "messages": [], "error": "Java runtime not found."}
-    tmp = None
+    remaining = deadline - time.time()
+    if remaining <= 0:
+        return {"available": True, "valid": None, "messages": [], "error": "Validation timed out."}
+    cmd = [java_exec, "-Xshare:auto", "-XX:TieredStopAtLevel=1", "-jar", VNU_PATH, "--format", "json", "-"]
     try:
-        tmp = tempfile.NamedTemporaryFile(delete=False, suffix=".html", mode="wb")
-        tmp.write(html_text.encode("utf-8"))
-        tmp.close()
-        cmd = [java_exec, "-jar", VNU_PATH, "--format", "json", tmp.name]
-        proc = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            encoding="utf-8",
-            timeout=VNU_RUN_TIMEOUT
-        )
-        stdout = proc.stdout.strip() if proc.stdout else ""
-        stderr = proc.stderr.strip() if proc.stderr else ""
-        raw = stderr or stdout
-        if proc.returncode == 0:
-            return {"available": True, "valid": True, "messages": [], "error": None}
-        else:
-            try:
-                parsed = json.loads(raw)
-                messages = parsed.get("messages", [])
-            except Exception:
-                messages = [{"type": "error", "message": raw}]
-            return {"available": True, "valid": False, "messages": messages, "error": None}
+        # vnu writes its JSON report to stderr; nothing useful goes to stdout.
+        proc = subprocess.Popen(cmd, stdin=subprocess.PIPE, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+    except Exception as e:
+        return {"available": True, "valid": None, "messages": [], "error": str(e)}
+    try:
+        # communicate() feeds stdin and drains stderr side by side, and its
+        # timeout does not depend on the pipe reaching EOF.
+        _, raw = proc.communicate(input=html_text.encode("utf-8"), timeout=remaining)
     except subprocess.TimeoutExpired:
+        proc.kill()
+        # A child forked by a java wrapper may still hold stderr open; don't wait on it.
+        proc.stderr.close()
+        try:
+            proc.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            pass
         return {"available": True, "valid": None, "messages": [], "error": "Validation timed out."}
     except Exception as e:
+        proc.kill()
         return {"available": True, "valid": None, "messages": [], "error": str(e)}
-    finally:
-        if tmp is not None:
-            try:
-                os.unlink(tmp.name)
-            except Exception:
-                pass
+    returncode = proc.returncode
+    if returncode == 0:
+        return {"available": True, "valid": True, "messages": [], "error": None}
+    try:
+        messages = json.loads(raw).get("messages", [])
+    except Exception:
+        messages = [{"type": "error", "message": raw.decode("utf-8", "replace").strip()}]
+    return {"available": True, "valid": False, "messages": messages, "error": None}
 
 # ----------------------------
 # Selenium fetch
 # ----------------------------
-def selenium_fetch(url):
+def build_chrome_options():
     options = Options()
     options.add_argument("--headless=new")
     options.add_argument("--disable-gpu")
     options.add_argument("--no-sandbox")
     options.add_argument("--disable-dev-shm-usage")
     options.add_argument("--window-size=1400,1000")
-    driver = webdriver.Chrome(options=options)
-    start_time = time.time()
-    driver.get(url)
-    time.sleep(2)
+    if not CAPTURE_SCREENSHOT:
+        options.add_experimental_option("prefs", {"profile.managed_default_content_settings.images": 2})
+    return options
+
+def create_driver():
+    driver = webdriver.Chrome(options=build_chrome_options())
+    try:
+        driver.execute_cdp_cmd("Network.enable", {})
+    except Exception:
+        pass
+    return driver
+
+def block_subresources(driver, url):
+    # The block list also applies to the top-level navigation, so never let it
+    # match the page being audited.
+    target = url.lower()
+    patterns = [p for p in BLOCKED_URL_PATTERNS if not fnmatch.fnmatchcase(target, p)]
     try:
-        perf = driver.execute_script(
-            "return (window.performance.timing.loadEventEnd - window.performance.timing.navigationStart);"
-        )
-        page_load_ms = int(perf) if perf and int(perf) > 0 else None
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": patterns})
     except Exception:
-        page_load_ms = None
-    page_source = driver.page_source
-    screenshot_path = os.path.join(ROOT, "page_preview.png")
-    driver.save_screenshot(screenshot_path)
-    driver.quit()
-    duration_ms = int((time.time() - start_time) * 1000)
-    return page_source, screenshot_path, page_load_ms, duration_ms
+        pass
+
+class DriverPool:
+    """Keeps headless Chrome instances warm so audits skip browser startup."""
+
+    def __init__(self, size=DRIVER_POOL_SIZE):
+        self.size = max(1, size)
+        self._idle = queue.Queue()
+        self._drivers = []
+        self._lock = threading.Lock()
+        self.last_used = time.time()
+
+    def _reserve_slot(self):
+        with self._lock:
+            if len(self._drivers) < self.size:
+                self._drivers.append(None)
+                return True
+        return False
+
+    def _fill_slot(self):
+        try:
+            driver = create_driver()
+        except Exception:
+            with self._lock:
+                self._drivers.remove(None)
+            raise
+        with self._lock:
+            self._drivers[self._drivers.index(None)] = driver
+        return driver
+
+    def warm(self):
+        while self._reserve_slot():
+            self._idle.put(self._fill_slot())
+
+    def acquire(self):
+        with self._lock:
+            self.last_used = time.time()
+            try:
+                return self._idle.get_nowait()
+            except queue.Empty:
+                pass
+        # Another thread (e.g. the warm-up) may hold the last slot. Poll so a
+        # failed launch there frees the slot for us instead of blocking forever.
+        while True:
+            if self._reserve_slot():
+                return self._fill_slot()
+            try:
+                return self._idle.get(timeout=0.5)
+            except queue.Empty:
+                continue
+
+    def release(self, driver):
+        try:
+            # Wipe state so the next audit doesn't inherit anything from this site;
+            # sessionStorage lives with the tab, so it is cleared from the page itself.
+            origin = driver.execute_script(
+                "try { window.sessionStorage.clear(); } catch (e) {} return window.location.origin;"
+            )
+            if origin and origin != "null":
+                driver.execute_cdp_cmd("Storage.clearDataForOrigin", {"origin": origin, "storageTypes": "all"})
+            driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+            driver.execute_cdp_cmd("Network.clearBrowserCache", {})
+            driver.get("about:blank")
+        except Exception:
+            self.discard(driver)
+            return
+        self.last_used = time.time()
+        self._idle.put(driver)
+
+    def close_if_idle(self, max_idle):
+        with self._lock:
+            if time.time() - self.last_used < max_idle or self._idle.qsize() != len(self._drivers):
+                return False
+            drivers = []
+            while True:
+                try:
+                    drivers.append(self._idle.get_nowait())
+                except queue.Empty:
+                    break
+            self._drivers = []
+        for driver in drivers:
+            try:
+                driver.quit()
+            except Exception:
+                pass
+        return True
+
+    def discard(self, driver):
+        with self._lock:
+            if driver in self._drivers:
+                self._drivers.remove(driver)
+        try:
+            driver.quit()
+        except Exception:
+            pass
+
+    def close(self):
+        while True:
+            try:
+                self._idle.get_nowait()
+            except queue.Empty:
+                break
+        with self._lock:
+            drivers = [d for d in self._drivers if d is not None]
+            self._drivers = []
+        for driver in drivers:
+            try:
+                driver.quit()
+            except Exception:
+                pass
+
+POOL = DriverPool()
+atexit.register(POOL.close)
+EXECUTOR = ThreadPoolExecutor(max_workers=4)
+
+def selenium_fetch(url):
+    driver = POOL.acquire()
+    try:
+        block_subresources(driver, url)
+        start_time = time.time()
+        driver.get(url)
+        try:
+            WebDriverWait(driver, PAGE_LOAD_TIMEOUT).until(
+                lambda d: d.execute_script(
+                    "return document.readyState === 'complete' && window.performance.timing.loadEventEnd > 0;"
+                )
+            )
+        except TimeoutException:
+            pass
+        try:
+            perf = driver.execute_script(
+                "return (window.performance.timing.loadEventEnd - window.performance.timing.navigationStart);"
+            )
+            page_load_ms = int(perf) if perf and int(perf) > 0 else None
+        except Exception:
+            page_load_ms = None
+        page_source = driver.page_source
+        screenshot_png = None
+        if CAPTURE_SCREENSHOT:
+            shot = driver.execute_cdp_cmd("Page.captureScreenshot", {"format": "png"})
+            screenshot_png = base64.b64decode(shot["data"])
+        duration_ms = int((time.time() - start_time) * 1000)
+    except Exception:
+        POOL.discard(driver)
+        raise
+    POOL.release(driver)
+    return page_source, screenshot_png, page_load_ms, duration_ms
 
 # ----------------------------
 # Parsing & audit logic
 # ----------------------------
 def parse_robots_meta(content):
-    content = (content or "").lower()
+    found = {m.group(0).lower() for m in ROBOTS_RE.finditer(content or "")}
     return {
-        "Indexing": "Allowed" if "noindex" not in content else "Disallowed",
-        "Following Links": "Allowed" if "nofollow" not in content else "Disallowed",
-        "Snippets": "Allowed" if "nosnippet" not in content else "Disallowed",
-        "Image Previews": ("Large" if "max-image-preview:large" in content else
-                           "Standard" if "max-image-preview:standard" in content else
-                           "None" if "max-image-preview:none" in content else "Not specified")
+        "Indexing": "Allowed" if "noindex" not in found else "Disallowed",
+        "Following Links": "Allowed" if "nofollow" not in found else "Disallowed",
+        "Snippets": "Allowed" if "nosnippet" not in found else "Disallowed",
+        "Image Previews": ("Large" if "max-image-preview:large" in found else
+                           "Standard" if "max-image-preview:standard" in found else
+                           "None" if "max-image-preview:none" in found else "Not specified")
     }
 
+def detect_doctype(html):
+    match = DOCTYPE_RE.match(html[:512].encode("utf-8", "ignore"))
+    if not match:
+        return "Missing"
+    return match.group(1).decode("utf-8", "ignore").strip() or "html"
+
+def summarize_page(lang, title, h1s, canonical, images, metas):
+    robots = next((m for m in metas if m.get("name") == "robots"), None)
+    return {
+        "lang": lang or None,
+        "title": title or None,
+        "h1s": h1s,
+        "canonical": canonical or None,
+        "images_total": len(images),
+        "images_with_alt": sum(1 for img in images if img.get("alt")),
+        "images_list": [{"src": img.get("src"), "alt": img.get("alt")} for img in images],
+        "robots_content": (robots.get("content") if robots else None) or "",
+        "og_tags": [m["property"] for m in metas if (m.get("property") or "").startswith("og:")],
+        "twitter_tags": [m["name"] for m in metas if (m.get("name") or "").startswith("twitter:")],
+    }
+
+def parse_page_selectolax(html):
+    tree = LexborHTMLParser(html)
+    lang = title = canonical = None
+    h1s, images, metas = [], [], []
+    # One walk over the tree, dispatching on tag name.
+    for node in tree.root.traverse() if tree.root is not None else ():
+        tag = node.tag
+        if tag == "meta":
+            metas.append(node.attributes)
+        elif tag == "img":
+            images.append(node.attributes)
+        elif tag == "h1":
+            h1s.append(node.text().strip())
+        elif tag == "link" and canonical is None:
+            if "canonical" in (node.attributes.get("rel") or "").lower().split():
+                canonical = node.attributes.get("href")
+        elif tag == "title" and title is None:
+            title = node.text().strip()
+        elif tag == "html" and lang is None:
+            lang = node.attributes.get("lang")
+    return summarize_page(lang, title, h1s, canonical, images, metas)
+
+def parse_page_bs4(html):
+    try:
+        soup = BeautifulSoup(html, "lxml")
+    except Exception:
+        soup = BeautifulSoup(html, "html5lib")
+    lang = title = canonical = None
+    h1s, images, metas = [], [], []
+    for el in soup.find_all(True):
+        name = el.name
+        if name == "meta":
+            metas.append(el.attrs)
+        elif name == "img":
+            images.append(el.attrs)
+        elif name == "h1":
+            h1s.append(el.text.strip())
+        elif name == "link" and canonical is None:
+            if "canonical" in (rel.lower() for rel in el.get("rel") or []):
+                canonical = el.get("href")
+        elif name == "title" and title is None:
+            title = el.string.strip() if el.string else None
+        elif name == "html" and lang is None:
+            lang = el.get("lang")
+    return summarize_page(lang, title, h1s, canonical, images, metas)
+
+def parse_page(html):
+    if LexborHTMLParser is not None:
+        try:
+            return parse_page_selectolax(html)
+        except Exception:
+            pass
+    return parse_page_bs4(html)
+
 def audit_website_selenium(url):
     result = {}
     try:
-        html, screenshot_path, page_load_ms, fetch_duration = selenium_fetch(url)
+        html, screenshot_png, page_load_ms, fetch_duration = selenium_fetch(url)
     except Exception as e:
         return {"error": f"❌ Failed to fetch URL with Selenium: {e}"}
+    # vnu runs in its own JVM (or server), so it overlaps with the parse
+    # below despite the GIL.
+    vnu_future = EXECUTOR.submit(validate_with_vnu, html)
     result["fetch_duration_ms"] = fetch_duration
-    result["screenshot"] = screenshot_path
+    result["screenshot"] = screenshot_png
     result["page_load_ms"] = page_load_ms
     result["raw_html"] = html
 
-    soup = BeautifulSoup(html, "html5lib")
-    doctype = next((str(item) for item in soup.contents if isinstance(item, type(soup.Doctype))), "Missing")
-    result["DOCTYPE"] = doctype
-    result["lang"] = soup.html.get("lang") if soup.html and soup.html.get("lang") else None
-    result["title"] = soup.title.string.strip() if soup.title and soup.title.string else None
-    h1s = [h.text.strip() for h in soup.find_all("h1")]
-    result["h1s"] = h1s
-    canonical = soup.find("link", rel="canonical")
-    result["canonical"] = canonical["href"] if canonical and canonical.get("href") else None
-    images = soup.find_all("img")
-    result["images_total"] = len(images)
-    result["images_with_alt"] = sum(1 for img in images if img.get("alt"))
-    result["images_list"] = [{"src": img.get("src"), "alt": img.get("alt")} for img in images]
-    robots = soup.find("meta", attrs={"name": "robots"})
-    result["robots_content"] = robots["content"] if robots and robots.get("content") else ""
+    result["DOCTYPE"] = detect_doctype(html)
+    result.update(parse_page(html))
     result["robots_parsed"] = parse_robots_meta(result["robots_content"])
-    ogs = [meta.get("property") for meta in soup.find_all("meta", property=lambda v: v and v.startswith("og:"))]
-    result["og_tags"] = ogs
-    twitters = [meta.get("name") for meta in soup.find_all("meta", attrs={"name": lambda v: v and v.startswith("twitter:")})]
-    result["twitter_tags"] = twitters
-    result["html5_validation"] = validate_with_vnu(html)
+    try:
+        result["html5_validation"] = vnu_future.result(timeout=VNU_RUN_TIMEOUT + 5)
+    except FutureTimeoutError:
+        result["html5_validation"] = {"available": True, "valid": None, "messages": [], "error": "Validation timed out."}
     return result
 
 # ----------------------------
 # GUI
 # ----------------------------
+def tk_text_length(text):
+    # Tk 8.6 counts non-BMP characters (emoji) as two index positions.
+    if tk.TkVersion >= 9.0:
+        return len(text)
+    return len(text.encode("utf-16-le")) // 2
+
 class App:
     def __init__(self, root):
         self.root = root
@@ -253,29 +672,58 @@ class App:
         self.preview_label.pack(fill="both", expand=True)
 
         ensure_validator_dir()
+        threading.Thread(target=self._warmup_driver, daemon=True).start()
         if not os.path.isfile(VNU_PATH):
             self._start_vnu_download()
+        else:
+            threading.Thread(target=self._check_vnu_jar, daemon=True).start()
+
+    def _post_status(self, text):
+        # Tk is not thread-safe; worker threads hand label updates to the main loop.
+        self.root.after(0, functools.partial(self.status_label.config, text=text))
+
+    def _warmup_driver(self):
+        # Start Chrome (and probe Java) while the user is still typing a URL.
+        find_java_executable()
+        try:
+            POOL.warm()
+        except Exception as e:
+            print("Chrome warm-up failed:", e)
+            return
+        timer = threading.Timer(DRIVER_IDLE_TIMEOUT, POOL.close_if_idle, args=(DRIVER_IDLE_TIMEOUT,))
+        timer.daemon = True
+        timer.start()
+
+    def _check_vnu_jar(self):
+        if vnu_jar_is_current():
+            start_vnu_server()
+        else:
+            self._post_status("Status: Updating vnu.jar...")
+            self._start_vnu_download()
 
     def _start_vnu_download(self):
         def progress_cb(downloaded, total):
             if total:
                 pct = int(downloaded * 100 / total)
-                self.status_label.config(text=f"Status: Downloading vnu.jar ({pct}%)")
+                self._post_status(f"Status: Downloading vnu.jar ({pct}%)")
             else:
-                self.status_label.config(text=f"Status: Downloading vnu.jar ({downloaded} bytes)")
+                self._post_status(f"Status: Downloading vnu.jar ({downloaded} bytes)")
 
         def do_download():
             ok, err = download_vnu_jar(progress_callback=progress_cb)
             if ok:
-                self.status_label.config(text="Status: vnu.jar downloaded — full HTML5 validation available")
+                self._post_status("Status: vnu.jar downloaded — full HTML5 validation available")
+                start_vnu_server()
             else:
-                self.status_label.config(text="Status: vnu.jar download failed")
+                self._post_status("Status: vnu.jar download failed")
                 print("vnu.jar download failed:", err)
+                if os.path.isfile(VNU_PATH):
+                    start_vnu_server()
 
         threading.Thread(target=do_download, daemon=True).start()
 
     def run_audit_thread(self, url):
-        self.status_label.config(text="Status: Running audit...")
+        self._post_status("Status: Running audit...")
         results = audit_website_selenium(url)
 
         def update_ui():
@@ -291,37 +739,40 @@ class App:
 
             # Screenshot
             try:
-                img = Image.open(results["screenshot"])
-                img = img.resize((420, 320))
+                img = Image.open(io.BytesIO(results["screenshot"]))
+                img.thumbnail((420, 320), Image.LANCZOS)
                 tk_img = ImageTk.PhotoImage(img)
                 self.preview_label.config(image=tk_img, text="")
                 self.preview_label.image = tk_img
             except Exception:
                 self.preview_label.config(text="No preview.")
 
+            # Collect (text, tag) pieces and hand them to Tk in one insert.
+            parts = []
+
+            def write(text, tag=None):
+                parts.append((text, tag))
+
             def insert_line(name, status, value, tag=None):
-                self.output_box.insert(tk.END, f"- {name}: ", "bold")
-                if tag:
-                    self.output_box.insert(tk.END, f"{status} {value}\n", tag)
-                else:
-                    self.output_box.insert(tk.END, f"{status} {value}\n")
+                write(f"- {name}: ", "bold")
+                write(f"{status} {value}\n", tag)
 
-            self.output_box.insert(tk.END, f"🔍 Website Audit: {url}\n")
-            self.output_box.insert(tk.END, f"⏱ Audit Duration: Fetched in {results['fetch_duration_ms']}ms\n")
+            write(f"🔍 Website Audit: {url}\n")
+            write(f"⏱ Audit Duration: Fetched in {results['fetch_duration_ms']}ms\n")
             if results.get('page_load_ms'):
-                self.output_box.insert(tk.END, f"⚡ Estimated Page Load: {results['page_load_ms']/1000:.2f}s\n\n")
+                write(f"⚡ Estimated Page Load: {results['page_load_ms']/1000:.2f}s\n\n")
             else:
-                self.output_box.insert(tk.END, f"⚡ Estimated Page Load: N/A\n\n")
+                write(f"⚡ Estimated Page Load: N/A\n\n")
 
             # Structure
-            self.output_box.insert(tk.END, "📄 Structure\n")
+            write("📄 Structure\n")
             insert_line("DOCTYPE", "✅" if results["DOCTYPE"] != "Missing" else "❌", results["DOCTYPE"],
                         "green" if results["DOCTYPE"] != "Missing" else "red")
             insert_line("HTML <lang>", "✅" if results["lang"] else "❌", results["lang"] or "Missing",
                         "green" if results["lang"] else "red")
 
             # SEO Essentials
-            self.output_box.insert(tk.END, "\n🔍 SEO Essentials\n")
+            write("\n🔍 SEO Essentials\n")
             title = results.get("title")
             if title:
                 tlen = len(title)
@@ -343,11 +794,11 @@ class App:
                         "green" if results.get("canonical") else "red")
 
             # Robots
-            self.output_box.insert(tk.END, "- Robots Meta:\n")
+            write("- Robots Meta:\n")
             robots_parsed = results.get("robots_parsed", {})
             for k, v in robots_parsed.items():
                 tag = "green" if (v in ("Allowed", "Large", "Standard", "Not specified")) else "red"
-                self.output_box.insert(tk.END, f"    ✅ {k}: {v}\n", tag)
+                write(f"    ✅ {k}: {v}\n", tag)
 
             # Images
             images_list = results.get("images_list", [])
@@ -360,7 +811,7 @@ class App:
                 for img in images_list:
                     src = img.get("src") or "(no src)"
                     alt = img.get("alt") or "(missing alt)"
-                    self.output_box.insert(tk.END, f"    - {src}: {alt}\n")
+                    write(f"    - {src}: {alt}\n")
 
             # OpenGraph / Twitter
             og_tags = results.get("og_tags", [])
@@ -370,26 +821,44 @@ class App:
 
             # HTML5 Validation
             v = results.get("html5_validation", {})
-            self.output_box.insert(tk.END, "\n🔎 HTML5 Validation & Actionables\n")
+            write("\n🔎 HTML5 Validation & Actionables\n")
             if not v.get("available"):
-                self.output_box.insert(tk.END, f"- Validator unavailable: {v.get('error') or 'vnu.jar or Java missing'}\n")
-                self.output_box.insert(tk.END, "- Performing basic structural checks instead.\n")
+                write(f"- Validator unavailable: {v.get('error') or 'vnu.jar or Java missing'}\n")
+                write("- Performing basic structural checks instead.\n")
             else:
                 if v.get("valid") is True:
-                    self.output_box.insert(tk.END, "- ✅ Page is valid HTML5 (no errors)\n", "green")
+                    write("- ✅ Page is valid HTML5 (no errors)\n", "green")
                 elif v.get("valid") is False:
-                    self.output_box.insert(tk.END, f"- ❌ Page has {len(v.get('messages', []))} HTML5 issues\n", "red")
-                    self.output_box.insert(tk.END, "- Actionable tips:\n", "bold")
+                    write(f"- ❌ Page has {len(v.get('messages', []))} HTML5 issues\n", "red")
+                    write("- Actionable tips:\n", "bold")
                     for m in v.get("messages", []):
                         typ = m.get("type", "info").upper()
                         msg = m.get("message") or m.get("extract") or str(m)
                         line = m.get("lastLine") or m.get("firstLine") or ""
-                        self.output_box.insert(tk.END, f"    - {typ} line {line}: {msg}\n")
+                        write(f"    - {typ} line {line}: {msg}\n")
                 else:
-                    self.output_box.insert(tk.END, f"- Validation run but result unknown: {v.get('error')}\n")
+                    write(f"- Validation run but result unknown: {v.get('error')}\n")
 
+            self.output_box.insert(tk.END, "".join(text for text, _ in parts))
+            ranges = {}
+            offset = 0
+            for text, tag in parts:
+                end = offset + tk_text_length(text)
+                if tag:
+                    spans = ranges.setdefault(tag, [])
+                    if spans and spans[-1][1] == offset:
+                        spans[-1][1] = end
+                    else:
+                        spans.append([offset, end])
+                offset = end
+            for tag, spans in ranges.items():
+                indices = []
+                for start, end in spans:
+                    indices += [f"1.0+{start}c", f"1.0+{end}c"]
+                self.output_box.tag_add(tag, *indices)
             self.output_box.config(state=tk.DISABLED)
             self.status_label.config(text="Status: Ready")
+            self.output_box.update_idletasks()
 
         self.root.after(0, update_ui)
 
@@ -406,8 +875,7 @@ class App:
             try:
                 self.run_audit_thread(url)
             finally:
-                time.sleep(1)
-                self.scan_button.config(state=tk.NORMAL)
+                self.root.after(0, functools.partial(self.scan_button.config, state=tk.NORMAL))
         threading.Thread(target=wrapper, daemon=True).start()
 
     def save_report(self):